@@ -1,14 +1,181 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from tkinter import font as tkfont
 import serial
 import serial.tools.list_ports
+import logging
+import os
+import queue
+import re
 import threading
 import time
 import math
-import datetime
 import random
+from collections import deque
+
+# Debug output goes through logging; run with AIRLOCK_DEBUG=1 to see it
+log = logging.getLogger(__name__)
+
+# Dim yellow shadow drawn behind moving gates (30, 30, 0)
+_GATE_BLUR_COLOR = "#1e1e00"
+
+# Yellow at every 0-255 intensity, indexed by particle alpha
+_YELLOW_LEVELS = tuple(f"#{level:02x}{level:02x}00" for level in range(256))
+
+# Pulsing yellow for moving gates, one sine period in 64 steps. The
+# brightness is quantized to 16 buckets so consecutive frames usually
+# share a color and the gate fill isn't reconfigured every frame
+_PULSE_COLORS = tuple(
+    _YELLOW_LEVELS[int(255 * (round(abs(math.sin(2 * math.pi * i / 64)) * 15) / 15 * 0.2 + 0.8))]
+    for i in range(64)
+)
+_PULSE_INDEX_SCALE = 3 * 64 / (2 * math.pi)  # Seconds -> _PULSE_COLORS index for sin(t * 3)
+
+# Idle gate fill, indexed by the gate's open state
+_GATE_IDLE_COLORS = ('#ff0000', '#00ff00')
+
+# Gate status label (text, fill), keyed by (moving, target_state if moving else open)
+_GATE_STATUS = {
+    (True, True): ("[OPENING]", 'yellow'),
+    (True, False): ("[CLOSING]", 'yellow'),
+    (False, True): ("[OPEN]", 'white'),
+    (False, False): ("[CLOSED]", 'white'),
+}
+
+# Serial frames look like <NAME:VALUE,NAME:VALUE>
+_FRAME_RE = re.compile(rb"<([^<>]*)>")
+_PAIR_RE = re.compile(r"([A-Z_]+):([01])")
+_RX_BUFFER_LIMIT = 1024  # Drop unterminated input beyond this many bytes
+
+# Sensor values sent to the Arduino, packed into one int. Bit positions
+# follow the field order of the outgoing frame
+BIT_PRESENCE_FRONT = 0
+BIT_PRESENCE_MIDDLE = 1
+BIT_PRESENCE_BACK = 2
+BIT_GATE_SAFETY_A = 3
+BIT_GATE_SAFETY_B = 4
+BIT_GATE_MOVING_A = 5
+BIT_GATE_MOVING_B = 6
+_SENSOR_FIELDS = (('PRESENCE_FRONT', BIT_PRESENCE_FRONT),
+                  ('PRESENCE_MIDDLE', BIT_PRESENCE_MIDDLE),
+                  ('PRESENCE_BACK', BIT_PRESENCE_BACK),
+                  ('GATE_SAFETY_A', BIT_GATE_SAFETY_A),
+                  ('GATE_SAFETY_B', BIT_GATE_SAFETY_B),
+                  ('GATE_MOVING_A', BIT_GATE_MOVING_A),
+                  ('GATE_MOVING_B', BIT_GATE_MOVING_B))
+
+# The outgoing frame for every possible sensor bitmask
+_SENSOR_FRAMES = tuple(
+    "<" + ",".join(f"{name}:{bits >> bit & 1}" for name, bit in _SENSOR_FIELDS) + ">"
+    for bits in range(1 << len(_SENSOR_FIELDS))
+)
+
+# Gate request handling: (request, moving, target_state if moving else open)
+# -> description of the movement to start. Missing keys need no change
+_GATE_TRANSITIONS = {
+    (True, False, False): "Starting to open",
+    (True, True, False): "Switching to opening mid-movement",
+    (False, False, True): "Starting to close",
+    (False, True, True): "Switching to closing mid-movement",
+}
+
+MAX_PARTICLES = 256  # Per-gate particle capacity
+PARTICLE_STRIP_WIDTH = 64  # Width of each gate's particle image; particles drift < 30 px
+
+class ParticleBuffer:
+    """Fixed-capacity particle storage kept as parallel lists (one per field).
+    Particles stay in emission order, oldest first"""
+    
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.count = 0  # Live particles occupy indices [0, count)
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0.0] * capacity
+        self.size = [0.0] * capacity
+    
+    def __len__(self):
+        return self.count
+    
+    def emit(self, x, y, vx, vy, size):
+        """Add a particle with full life - dropped if the buffer is full"""
+        i = self.count
+        if i >= self.capacity:
+            return
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = 1.0
+        self.size[i] = size
+        self.count = i + 1
+    
+    def update(self):
+        """Advance all particles one step and compact out the dead ones"""
+        self.count = step_particles(self.x, self.y, self.vx, self.vy,
+                                    self.life, self.size, self.count)
+
+def step_particles(x, y, vx, vy, life, size, n):
+    """Advance the first n particles in place, compact survivors to the front
+    and return the new live count. Pure numeric loop over flat sequences."""
+    alive = 0
+    for i in range(n):
+        new_life = life[i] - 0.015  # Very slow fade out
+        new_size = size[i] * 0.998  # Very slow size reduction
+        if new_life > 0 and new_size > 0.9:  # Live longer
+            x[alive] = x[i] + vx[i]
+            y[alive] = y[i] + vy[i]
+            if alive != i:  # Velocities only move once a dead particle left a gap
+                vx[alive] = vx[i]
+                vy[alive] = vy[i]
+            life[alive] = new_life
+            size[alive] = new_size
+            alive += 1
+    return alive
+
+def ease_in_out_cubic(t):
+    """Smooth easing function for natural movement"""
+    if t < 0.5:
+        return 4 * t * t * t
+    u = 2 - 2 * t
+    return 1 - u * u * u / 2
+
+class Gate:
+    """Open/close animation state for one airlock gate"""
+    
+    def __init__(self, name, x):
+        self.name = name  # 'A' or 'B', the suffix used in the serial protocol
+        self.x = x  # Offset from the left edge of the airlock
+        self.open = False
+        self.moving = False
+        self.target_state = False  # True = opening, False = closing
+        self.progress = 0  # 0 = closed, 1 = fully open
+        self.animation_time = 0  # Time elapsed during animation
+        self.left = self.right = 0  # Canvas x of the gate edges, set by the layout
+        self.particles = ParticleBuffer()  # Particle effects for this gate
+        self.moving_bit = BIT_GATE_MOVING_A if name == 'A' else BIT_GATE_MOVING_B
+        self.safety_bit = BIT_GATE_SAFETY_A if name == 'A' else BIT_GATE_SAFETY_B
+        self.request_key = f"GATE_REQUEST_{name}"
 
 class AirlockGUI:
+    # Terminal message styles: msg_type -> (color tag, prefix)
+    _MSG_STYLES = {
+        "SENT": ("sent", ">> "),
+        "RECEIVED": ("received", "<< "),
+        "INFO": ("info", "-- "),
+        "ERROR": ("error", "!! "),
+    }
+    _DEFAULT_MSG_STYLE = ("default", "   ")
+    
+    # Sensor state label styles, passed straight to configure()
+    _LABEL_ON = {'text': "ON", 'bg': '#00ff00', 'fg': 'black'}
+    _LABEL_OFF = {'text': "OFF", 'bg': '#4a4a4a', 'fg': 'white'}
+    
+    # Independently redrawable parts of the canvas
+    _DISPLAY_PARTS = ('zones', 'gates', 'particles', 'rover')
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Airlock HIL Simulator")
@@ -18,6 +185,13 @@ class AirlockGUI:
         # Serial connection
         self.ser = None
         self.connected = False
+        self._rx_queue = queue.Queue()  # Raw reads from the reader thread
+        self._rx_error = None  # Read failure reported by the reader thread, handled by poll_serial
+        self._rxbuf = bytearray()  # Received bytes not yet parsed into frames
+        self.serial_poll_interval = 50  # ms between received-data checks
+        self._tx_queue = queue.Queue(maxsize=64)  # Encoded commands for the writer thread
+        self._tx_frames = deque(maxlen=1)  # Newest sensor frame - older states are stale
+        self._last_echoed_frame = None  # Last written frame shown as SENT, used by the writer thread
         
         # Airlock dimensions (scaled down for display)
         self.scale = 0.5  # Reduced scale to fit better with terminal
@@ -33,43 +207,30 @@ class AirlockGUI:
         self.rover_x = 50  # Start position - outside front zone
         self.rover_y = self.airlock_height // 2 + 50  # Adjust for canvas position
         self.rover_dragging = False
+        self._pending_x = None  # Rover x waiting to be applied on the next idle pass
+        self._move_scheduled = False
         
         # Gate properties
         self.gate_width = 10
-        self.gate_a_x = self.front_zone_width
-        self.gate_b_x = self.front_zone_width + self.middle_zone_width
-        self.gate_a_open = False
-        self.gate_b_open = False
-        self.gate_a_moving = False
-        self.gate_b_moving = False
-        self.gate_animation_progress_a = 0
-        self.gate_animation_progress_b = 0
+        self.gate_a = Gate('A', self.front_zone_width)
+        self.gate_b = Gate('B', self.front_zone_width + self.middle_zone_width)
+        self.gates = (self.gate_a, self.gate_b)
         
         # Enhanced animation properties
-        self.gate_a_animation_time = 0  # Time elapsed during animation
-        self.gate_b_animation_time = 0
         self.gate_animation_duration = 3.0  # Total animation duration in seconds
-        self.gate_a_particles = []  # Particle effects for gate A
-        self.gate_b_particles = []  # Particle effects for gate B
+        self.animation_interval = 100  # ms between animation ticks
+        self._rng = random.Random(42)  # Private, seeded RNG keeps particle effects deterministic
+        self._particle_tick = 0  # Animation tick counter paces particle emission
         
-        # Gate movement direction tracking
-        self.gate_a_target_state = False  # True = opening, False = closing
-        self.gate_b_target_state = False  # True = opening, False = closing
         
         # Drawing positions
         self.start_x = 100
         self.start_y = 50
+        self.safety_zone_width = 60
+        self._recompute_layout()  # Sensor positions, gate edges and rover bounds
         
-        # Sensor states
-        self.sensor_states = {
-            'PRESENCE_FRONT': False,
-            'PRESENCE_MIDDLE': False,
-            'PRESENCE_BACK': False,
-            'GATE_SAFETY_A': False,
-            'GATE_SAFETY_B': False,
-            'GATE_MOVING_A': False,
-            'GATE_MOVING_B': False
-        }
+        # Sensor states, one BIT_* flag each
+        self._sensor_bits = 0
         
         # Gate requests from Arduino
         self.gate_requests = {
@@ -77,19 +238,35 @@ class AirlockGUI:
             'GATE_REQUEST_B': False
         }
         
-        # Anti-flicker system
-        self.update_pending = False
+        # Received field name -> handler(bool value)
+        self._rx_handlers = {name: (lambda value, name=name: self.set_gate_request(name, value))
+                             for name in self.gate_requests}
+        
+        # Terminal messages waiting to be written by the GUI thread
+        self._term_queue = deque()
+        self.terminal_flush_interval = 50  # ms between terminal flushes
+        self.terminal_max_lines = 5000  # Trim the terminal once it grows past this
+        self.terminal_trim_lines = 4000  # Lines kept after trimming
+        self._last_second = None  # Timestamp cache for terminal lines
+        self._last_hms = ""
+        
+        # Anti-flicker system: state changes add the parts they affect to
+        # _dirty and one redraw is scheduled, no more often than min_update_interval
+        self._dirty = set()  # Any of _DISPLAY_PARTS waiting to be redrawn
+        self._display_dirty = False  # A redraw is scheduled
         self.last_update_time = 0
-        self.min_update_interval = 0.1  # Minimum 100ms between updates
+        self._frame_time = 0  # Clock snapshot shared by everything drawn in one frame
+        self.min_update_interval = 1 / 30  # Redraw at most 30 times a second
         
         # Control flags
         self.needs_redraw = True
         
         self.setup_gui()
         self.start_reading_thread()
-        self.start_animation_thread()
-        self.start_sensor_update_thread()  # Add periodic sensor updates
-        self.start_sensor_display_update_thread()  # Add periodic sensor display updates
+        self.start_writing_thread()
+        # Parsing, animation, sensor sends and display refresh all run on the Tk thread
+        self.root.after(self.serial_poll_interval, self.poll_serial)
+        self.root.after(self.animation_interval, self._tick)
         
     def setup_gui(self):
         # Main title
@@ -150,6 +327,8 @@ class AirlockGUI:
         
         # Create horizontal sensor table
         self.sensor_labels = {}
+        self._sensor_last = {}  # Last style applied to each state label
+        self._state_font = tkfont.Font(family='Arial', size=10, weight='bold')  # Shared by all state labels
         
         # Main container for horizontal layout
         table_container = tk.Frame(sensor_frame, bg='#1a1a1a')
@@ -176,10 +355,9 @@ class AirlockGUI:
             name_label.pack(fill='x')
             
             # State label (bottom)
-            state_label = tk.Label(sensor_col, text="OFF", 
-                                  font=('Arial', 10, 'bold'), 
-                                  fg='white', bg='#4a4a4a',
-                                  relief='raised', bd=1, pady=4)
+            state_label = tk.Label(sensor_col, font=self._state_font,
+                                  relief='raised', bd=1, pady=4,
+                                  **self._LABEL_OFF)
             state_label.pack(fill='x')
             
             self.sensor_labels[sensor_name] = state_label
@@ -204,10 +382,9 @@ class AirlockGUI:
             name_label.pack(fill='x')
             
             # State label (bottom)
-            state_label = tk.Label(sensor_col, text="OFF", 
-                                  font=('Arial', 10, 'bold'), 
-                                  fg='white', bg='#4a4a4a',
-                                  relief='raised', bd=1, pady=4)
+            state_label = tk.Label(sensor_col, font=self._state_font,
+                                  relief='raised', bd=1, pady=4,
+                                  **self._LABEL_OFF)
             state_label.pack(fill='x')
             
             self.sensor_labels[sensor_name] = state_label
@@ -243,6 +420,13 @@ class AirlockGUI:
                                                         wrap=tk.WORD)
         self.terminal_output.pack(pady=5, padx=5, fill=tk.BOTH, expand=True)
         
+        # Configure color tags once
+        self.terminal_output.tag_configure("sent", foreground="#ffff00")
+        self.terminal_output.tag_configure("received", foreground="#00ff00")
+        self.terminal_output.tag_configure("info", foreground="#00aaff")
+        self.terminal_output.tag_configure("error", foreground="#ff0000")
+        self.terminal_output.tag_configure("default", foreground="#ffffff")
+        
         # Terminal input frame
         input_frame = tk.Frame(terminal_frame, bg='#2a2a2a')
         input_frame.pack(fill=tk.X, pady=5, padx=5)
@@ -279,8 +463,12 @@ class AirlockGUI:
         self.auto_scroll_check.pack(side=tk.RIGHT)
         self.auto_scroll = auto_scroll_var
         
+        # Start flushing queued terminal messages
+        self.root.after(self.terminal_flush_interval, self._drain_terminal)
+        
         # Draw initial airlock
         self.draw_airlock_static()
+        self.build_dynamic_items()
         self.update_display()
         
         # Bind controls
@@ -299,49 +487,55 @@ class AirlockGUI:
         self.add_terminal_message("Commands are sent with < > delimiters automatically", "INFO")
         
         # Debug: Show initial gate states
-        print(f"DEBUG: Initial gate states:")
-        print(f"DEBUG: Gate A - Open: {self.gate_a_open}, Moving: {self.gate_a_moving}, Target: {self.gate_a_target_state}")
-        print(f"DEBUG: Gate B - Open: {self.gate_b_open}, Moving: {self.gate_b_moving}, Target: {self.gate_b_target_state}")
-        print(f"DEBUG: Gate requests: {self.gate_requests}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Initial gate states:")
+            for gate in self.gates:
+                log.debug("Gate %s - Open: %s, Moving: %s, Target: %s",
+                          gate.name, gate.open, gate.moving, gate.target_state)
+            log.debug("Gate requests: %s", self.gate_requests)
         
     def add_terminal_message(self, message, msg_type="DATA"):
-        """Add a message to the terminal with timestamp and formatting"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        
-        self.terminal_output.config(state=tk.NORMAL)
-        
-        # Color coding based on message type
-        if msg_type == "SENT":
-            color_tag = "sent"
-            prefix = ">> "
-        elif msg_type == "RECEIVED":
-            color_tag = "received"
-            prefix = "<< "
-        elif msg_type == "INFO":
-            color_tag = "info"
-            prefix = "-- "
-        elif msg_type == "ERROR":
-            color_tag = "error"
-            prefix = "!! "
-        else:
-            color_tag = "default"
-            prefix = "   "
-        
-        # Configure color tags
-        self.terminal_output.tag_configure("sent", foreground="#ffff00")
-        self.terminal_output.tag_configure("received", foreground="#00ff00")
-        self.terminal_output.tag_configure("info", foreground="#00aaff")
-        self.terminal_output.tag_configure("error", foreground="#ff0000")
-        self.terminal_output.tag_configure("default", foreground="#ffffff")
-        
-        formatted_message = f"[{timestamp}] {prefix}{message}\n"
-        self.terminal_output.insert(tk.END, formatted_message, color_tag)
-        
-        # Auto scroll if enabled
-        if self.auto_scroll.get():
-            self.terminal_output.see(tk.END)
+        """Queue a message for the terminal - safe to call from any thread"""
+        self._term_queue.append((time.time(), msg_type, message))
+    
+    def _drain_terminal(self):
+        """Write all queued terminal messages with a single insert"""
+        pending = self._term_queue
+        if pending:
+            chunks = []
+            while pending:
+                try:
+                    msg_time, msg_type, message = pending.popleft()
+                except IndexError:
+                    break
+                # Format H:M:S only when the second changes, then append milliseconds
+                second = int(msg_time)
+                if second != self._last_second:
+                    self._last_second = second
+                    self._last_hms = time.strftime("%H:%M:%S", time.localtime(second))
+                timestamp = f"{self._last_hms}.{int((msg_time - second) * 1000):03d}"
+                
+                # Color coding based on message type
+                color_tag, prefix = self._MSG_STYLES.get(msg_type, self._DEFAULT_MSG_STYLE)
+                chunks.append(f"[{timestamp}] {prefix}{message}\n")
+                chunks.append(color_tag)
+            
+            self.terminal_output.config(state=tk.NORMAL)
+            # Text.insert accepts alternating text/tag pairs in one call
+            self.terminal_output.insert(tk.END, *chunks)
+            
+            # Keep the terminal bounded - drop the oldest lines past the cap
+            lines = int(self.terminal_output.index('end-1c').split('.')[0])
+            if lines > self.terminal_max_lines:
+                self.terminal_output.delete('1.0', f'{lines - self.terminal_trim_lines}.0')
+            
+            # Auto scroll if enabled
+            if self.auto_scroll.get():
+                self.terminal_output.see(tk.END)
+            
+            self.terminal_output.config(state=tk.DISABLED)
         
-        self.terminal_output.config(state=tk.DISABLED)
+        self.root.after(self.terminal_flush_interval, self._drain_terminal)
     
     def send_command(self, event=None):
         """Send a custom command through the terminal"""
@@ -359,12 +553,9 @@ class AirlockGUI:
         if not command.endswith('>'):
             command = command + '>'
         
-        try:
-            self.ser.write(command.encode())
+        if self.queue_write(command.encode()):
             self.add_terminal_message(command, "SENT")
             self.command_entry.delete(0, tk.END)
-        except serial.SerialException as e:
-            self.add_terminal_message(f"Failed to send command: {str(e)}", "ERROR")
     
     def clear_terminal(self):
         """Clear the terminal output"""
@@ -403,355 +594,365 @@ class AirlockGUI:
         self.canvas.create_text(self.start_x + self.front_zone_width + self.middle_zone_width + self.back_zone_width/2, 
                               self.start_y + 20, text="BACK ZONE", fill='white', font=('Arial', 14, 'bold'), tags="static")
         
+        # Gate titles never change, only their status text is redrawn
+        for gate in self.gates:
+            self.canvas.create_text(self.start_x + gate.x, self.start_y - 25,
+                                  text=f"Gate {gate.name}", fill='white', font=('Arial', 12, 'bold'), tags="static")
+        
+    def build_dynamic_items(self):
+        """Create the sensor, gate and rover canvas items once - later frames only move/recolor them"""
+        # Particles are rasterized into a transparent image strip around each gate,
+        # sitting lowest, just above the static background. Strips are only as wide
+        # as particles drift, so repainting one damages a small part of the canvas
+        self._particle_strips = {}  # Gate name -> (image, canvas x of its left edge)
+        for gate in self.gates:
+            left = self.start_x + gate.x - PARTICLE_STRIP_WIDTH // 2
+            image = tk.PhotoImage(width=PARTICLE_STRIP_WIDTH, height=int(self.airlock_height))
+            self.canvas.create_image(left, self.start_y, image=image, anchor='nw', tags="particles")
+            self._particle_strips[gate.name] = (image, left)
+        self._painted_strips = set()  # Gate names whose strip isn't blank
+        
+        # Sensor zones, laid out by the _presence_sensors and _safety_zones tables.
+        # Rows of (sensor bit, shape id, shape color option, label id, active color, idle color)
+        self._zone_rows = []
+        self._zone_last_bits = 0  # Sensor bits the zone colors currently show
+        for bit, label, sensor_x in self._presence_sensors:
+            line_id = self.canvas.create_line(sensor_x, self._sensor_line_top,
+                                              sensor_x, self._sensor_line_bottom,
+                                              fill='#005500', width=5, dash=(8, 4), tags="sensor_zones")
+            text_id = self.canvas.create_text(sensor_x - 20, self.start_y + 10,
+                                              text=label, fill='#005500',
+                                              font=('Arial', 9, 'bold'), tags="sensor_zones")
+            self._zone_rows.append((bit, line_id, 'fill', text_id, '#00ff00', '#005500'))
+        
+        # Gate safety zones (keep these as areas)
+        for bit, label, gate_pos, zone_left, zone_right in self._safety_zones:
+            rect_id = self.canvas.create_rectangle(zone_left, self.start_y, zone_right,
+                                                   self.start_y + self.airlock_height,
+                                                   fill='', outline='#550000',
+                                                   width=3, dash=(3, 3), tags="sensor_zones")
+            text_id = self.canvas.create_text(gate_pos, self.start_y + self.airlock_height + 20,
+                                              text=label, fill='#550000',
+                                              font=('Arial', 10), tags="sensor_zones")
+            self._zone_rows.append((bit, rect_id, 'outline', text_id, '#ff0000', '#550000'))
+        
+        self._gate_items = {}
+        max_segments = int(self.airlock_height // 40)
+        for gate in self.gates:
+            self._gate_items[gate.name] = {
+                'blur': self.canvas.create_rectangle(0, 0, 0, 0, fill=_GATE_BLUR_COLOR, outline="",
+                                                     state='hidden', tags="gates"),
+                'body': self.canvas.create_rectangle(0, 0, 0, 0, outline='white', width=2, tags="gates"),
+                'segments': [self.canvas.create_line(0, 0, 0, 0, fill='#333333', width=1,
+                                                     state='hidden', tags="gates")
+                             for _ in range(max_segments)],
+                'status': self.canvas.create_text(self.start_x + gate.x, self.start_y - 10,
+                                                  font=('Arial', 9), tags="gates"),
+            }
+        # Per gate, the geometry/fill/blur/status values last sent to Tk
+        self._gate_item_state = {gate.name: {} for gate in self.gates}
+        
+        # Draw rover as a rectangle with direction indicator, placed at its
+        # current position once; after that the whole "rover" tag is moved
+        x, y = self.rover_x, self.rover_y
+        for kind, offsets, options in self._rover_template:
+            points = [offset + (y if i & 1 else x) for i, offset in enumerate(offsets)]
+            getattr(self.canvas, f"create_{kind}")(*points, tags="rover", **options)
+        self._rover_drawn = (x, y)  # Position the rover items are currently drawn at
+    
+    def _place_gate_segments(self, segment_ids, segment_ys, gate_left, gate_right, shown):
+        """Show one segment line per y position, given how many were shown before
+        
+        Returns the new number of shown lines. Lines already hidden are left alone.
+        """
+        canvas = self.canvas
+        coords = canvas.coords
+        itemconfig = canvas.itemconfig
+        count = min(len(segment_ys), len(segment_ids))
+        left = gate_left + 1
+        right = gate_right - 1
+        for i in range(count):
+            y = segment_ys[i]
+            coords(segment_ids[i], left, y, right, y)
+        for line_id in segment_ids[shown:count]:
+            itemconfig(line_id, state='normal')
+        for line_id in segment_ids[count:shown]:
+            itemconfig(line_id, state='hidden')
+        return count
+    
     def update_display(self):
         """Update only the dynamic parts of the display - now throttled"""
         self.request_update()
     
     def update_gates_only(self):
         """Update only the gates and particles - now throttled"""  
-        self.request_update()
+        self.request_update('gates', 'particles')
     
     def draw_sensor_zones(self):
-        # Calculate sensor line positions at center of each zone
-        front_sensor_x = self.start_x + self.front_zone_width / 2
-        middle_sensor_x = self.start_x + self.front_zone_width + self.middle_zone_width / 2
-        back_sensor_x = self.start_x + self.front_zone_width + self.middle_zone_width + self.back_zone_width / 2
-        
-        # Draw presence sensor lines
-        # Front presence sensor line
-        self.canvas.create_line(front_sensor_x, self.start_y + 20,
-                              front_sensor_x, self.start_y + self.airlock_height - 20,
-                              fill='#00ff00' if self.sensor_states['PRESENCE_FRONT'] else '#005500',
-                              width=5, dash=(8, 4), tags="sensor_zones")
-        self.canvas.create_text(front_sensor_x - 20, self.start_y + 10,
-                              text="FRONT", fill='#00ff00' if self.sensor_states['PRESENCE_FRONT'] else '#005500',
-                              font=('Arial', 9, 'bold'), tags="sensor_zones")
-        
-        # Middle presence sensor line
-        self.canvas.create_line(middle_sensor_x, self.start_y + 20,
-                              middle_sensor_x, self.start_y + self.airlock_height - 20,
-                              fill='#00ff00' if self.sensor_states['PRESENCE_MIDDLE'] else '#005500',
-                              width=5, dash=(8, 4), tags="sensor_zones")
-        self.canvas.create_text(middle_sensor_x - 20, self.start_y + 10,
-                              text="MIDDLE", fill='#00ff00' if self.sensor_states['PRESENCE_MIDDLE'] else '#005500',
-                              font=('Arial', 9, 'bold'), tags="sensor_zones")
-        
-        # Back presence sensor line
-        self.canvas.create_line(back_sensor_x, self.start_y + 20,
-                              back_sensor_x, self.start_y + self.airlock_height - 20,
-                              fill='#00ff00' if self.sensor_states['PRESENCE_BACK'] else '#005500',
-                              width=5, dash=(8, 4), tags="sensor_zones")
-        self.canvas.create_text(back_sensor_x - 20, self.start_y + 10,
-                              text="BACK", fill='#00ff00' if self.sensor_states['PRESENCE_BACK'] else '#005500',
-                              font=('Arial', 9, 'bold'), tags="sensor_zones")
-        
-        # Gate safety zones (keep these as areas)
-        safety_zone_width = 60
-        
-        # Gate A safety zone
-        self.canvas.create_rectangle(self.start_x + self.gate_a_x - safety_zone_width/2, self.start_y,
-                                   self.start_x + self.gate_a_x + safety_zone_width/2,
-                                   self.start_y + self.airlock_height,
-                                   fill='', outline='#ff0000' if self.sensor_states['GATE_SAFETY_A'] else '#550000',
-                                   width=3, dash=(3, 3), tags="sensor_zones")
-        self.canvas.create_text(self.start_x + self.gate_a_x, self.start_y + self.airlock_height + 20,
-                              text="Gate A Safety", fill='#ff0000' if self.sensor_states['GATE_SAFETY_A'] else '#550000',
-                              font=('Arial', 10), tags="sensor_zones")
-        
-        # Gate B safety zone
-        self.canvas.create_rectangle(self.start_x + self.gate_b_x - safety_zone_width/2, self.start_y,
-                                   self.start_x + self.gate_b_x + safety_zone_width/2,
-                                   self.start_y + self.airlock_height,
-                                   fill='', outline='#ff0000' if self.sensor_states['GATE_SAFETY_B'] else '#550000',
-                                   width=3, dash=(3, 3), tags="sensor_zones")
-        self.canvas.create_text(self.start_x + self.gate_b_x, self.start_y + self.airlock_height + 20,
-                              text="Gate B Safety", fill='#ff0000' if self.sensor_states['GATE_SAFETY_B'] else '#550000',
-                              font=('Arial', 10), tags="sensor_zones")
+        # Recolor persistent zone items only on sensor state transitions
+        bits = self._sensor_bits
+        changed = bits ^ self._zone_last_bits
+        if not changed:
+            return
+        self._zone_last_bits = bits
+        itemconfig = self.canvas.itemconfig
+        for bit, shape_id, shape_option, text_id, on_color, off_color in self._zone_rows:
+            if not changed >> bit & 1:
+                continue
+            color = on_color if bits >> bit & 1 else off_color
+            itemconfig(shape_id, **{shape_option: color})
+            itemconfig(text_id, fill=color)
         
     def draw_gates(self):
-        # Update and draw particles (but don't delete all particles every frame)
-        self.gate_a_particles = self.update_particles(self.gate_a_particles)
-        self.gate_b_particles = self.update_particles(self.gate_b_particles)
-        
-        # Only draw particles if there are particles to show
-        if self.gate_a_particles or self.gate_b_particles:
-            self.draw_particles(self.gate_a_particles)
-            self.draw_particles(self.gate_b_particles)
-        
-        # Gate A with enhanced animation
-        if self.gate_a_moving:
+        # Smoother pulsing effect (reduced frequency), one lookup shared by all moving gates
+        pulse_color = _PULSE_COLORS[int(self._frame_time * _PULSE_INDEX_SCALE) & 63]
+        draw_gate = self.draw_gate
+        for gate in self.gates:
+            draw_gate(gate, pulse_color)
+    
+    def draw_gate(self, gate, pulse_color):
+        """Position and color one gate's persistent canvas items"""
+        canvas = self.canvas
+        coords = canvas.coords
+        itemconfig = canvas.itemconfig
+        airlock_height = self.airlock_height
+        name = gate.name
+        moving = gate.moving
+        progress = gate.progress
+        is_open = gate.open
+        
+        if moving:
             # Use smooth cubic easing for both opening and closing
-            eased_progress = self.ease_in_out_cubic(self.gate_animation_progress_a)
+            eased_progress = ease_in_out_cubic(progress)
         else:
-            eased_progress = self.gate_animation_progress_a
+            eased_progress = progress
         
         # Smooth top-to-bottom animation
         # When closed: gate covers entire opening (y=start_y, height=full)
         # When open: gate is pushed down to bottom (y=start_y+height, height=minimal)
-        gate_a_y = self.start_y + (self.airlock_height * eased_progress)
-        gate_a_height = self.airlock_height * (1 - eased_progress)
+        gate_y = self.start_y + (airlock_height * eased_progress)
+        gate_height = airlock_height * (1 - eased_progress)
         
         # Ensure minimum visibility when fully open
-        if gate_a_height < 3:
-            gate_a_height = 3  # Keep a small visible portion when fully open
+        if gate_height < 3:
+            gate_height = 3  # Keep a small visible portion when fully open
+        gate_bottom = gate_y + gate_height
         
         # Enhanced gate colors with smoother effects
-        if self.gate_a_moving:
-            # Smoother pulsing effect (reduced frequency)
-            pulse = abs(math.sin(time.time() * 3)) * 0.2 + 0.8  # Slower and subtler pulse
-            gate_a_color = f"#{int(255*pulse):02x}{int(255*pulse):02x}00"  # Pulsing yellow
-            
-            # Simplified motion blur - just one subtle shadow
-            blur_alpha = 30
-            blur_color = f"#{blur_alpha:02x}{blur_alpha:02x}00"
-            self.canvas.create_rectangle(
-                self.start_x + self.gate_a_x - self.gate_width/2 - 2, gate_a_y - 2,
-                self.start_x + self.gate_a_x + self.gate_width/2 + 2,
-                gate_a_y + gate_a_height + 2,
-                fill=blur_color, outline="", tags="gates"
-            )
+        items = self._gate_items[name]
+        last = self._gate_item_state[name]
+        if moving:
+            gate_color = pulse_color  # Pulsing yellow
         else:
-            gate_a_color = '#00ff00' if self.gate_a_open else '#ff0000'
-        
-        # Main gate rectangle
-        self.canvas.create_rectangle(
-            self.start_x + self.gate_a_x - self.gate_width/2, gate_a_y,
-            self.start_x + self.gate_a_x + self.gate_width/2,
-            gate_a_y + gate_a_height,
-            fill=gate_a_color, outline='white', width=2, tags="gates"
-        )
-        
-        # Add mechanical details (only when gate is substantially visible)
-        if gate_a_height > 50:  # Increased threshold to reduce flicker
-            segment_height = 40  # Larger segments, fewer lines
-            for y in range(int(gate_a_y + segment_height), int(gate_a_y + gate_a_height), segment_height):
-                self.canvas.create_line(
-                    self.start_x + self.gate_a_x - self.gate_width/2 + 1, y,
-                    self.start_x + self.gate_a_x + self.gate_width/2 - 1, y,
-                    fill='#333333', width=1, tags="gates"
-                )
-        
-        # Gate A label with status
-        status_text = "OPENING" if (self.gate_a_moving and self.gate_a_target_state) else \
-                     "CLOSING" if (self.gate_a_moving and not self.gate_a_target_state) else \
-                     "OPEN" if self.gate_a_open else "CLOSED"
-        
-        self.canvas.create_text(
-            self.start_x + self.gate_a_x, self.start_y - 25,
-            text=f"Gate A", fill='white', font=('Arial', 12, 'bold'), tags="gates"
-        )
-        self.canvas.create_text(
-            self.start_x + self.gate_a_x, self.start_y - 10,
-            text=f"[{status_text}]", fill='yellow' if self.gate_a_moving else 'white', 
-            font=('Arial', 9), tags="gates"
-        )
-        
-        # Gate B with enhanced animation (same logic as Gate A)
-        if self.gate_b_moving:
-            # Use smooth cubic easing for both opening and closing
-            eased_progress = self.ease_in_out_cubic(self.gate_animation_progress_b)
-        else:
-            eased_progress = self.gate_animation_progress_b
-        
-        # Smooth top-to-bottom animation
-        gate_b_y = self.start_y + (self.airlock_height * eased_progress)
-        gate_b_height = self.airlock_height * (1 - eased_progress)
-        
-        # Ensure minimum visibility when fully open
-        if gate_b_height < 3:
-            gate_b_height = 3  # Keep a small visible portion when fully open
-        
-        if self.gate_b_moving:
-            # Smoother pulsing effect (reduced frequency)
-            pulse = abs(math.sin(time.time() * 3)) * 0.2 + 0.8  # Slower and subtler pulse
-            gate_b_color = f"#{int(255*pulse):02x}{int(255*pulse):02x}00"  # Pulsing yellow
+            gate_color = _GATE_IDLE_COLORS[is_open]
+        
+        # Move the items only when the gate actually moved
+        geometry = (gate_y, gate_bottom)
+        moved = geometry != last.get('geometry')
+        gate_left = gate.left
+        gate_right = gate.right
+        if moved:
+            last['geometry'] = geometry
             
-            # Simplified motion blur - just one subtle shadow
-            blur_alpha = 30
-            blur_color = f"#{blur_alpha:02x}{blur_alpha:02x}00"
-            self.canvas.create_rectangle(
-                self.start_x + self.gate_b_x - self.gate_width/2 - 2, gate_b_y - 2,
-                self.start_x + self.gate_b_x + self.gate_width/2 + 2,
-                gate_b_y + gate_b_height + 2,
-                fill=blur_color, outline="", tags="gates"
-            )
-        else:
-            gate_b_color = '#00ff00' if self.gate_b_open else '#ff0000'
-        
-        # Main gate rectangle
-        self.canvas.create_rectangle(
-            self.start_x + self.gate_b_x - self.gate_width/2, gate_b_y,
-            self.start_x + self.gate_b_x + self.gate_width/2,
-            gate_b_y + gate_b_height,
-            fill=gate_b_color, outline='white', width=2, tags="gates"
-        )
-        
-        # Add mechanical details (only when gate is substantially visible)
-        if gate_b_height > 50:  # Increased threshold to reduce flicker
-            segment_height = 40  # Larger segments, fewer lines
-            for y in range(int(gate_b_y + segment_height), int(gate_b_y + gate_b_height), segment_height):
-                self.canvas.create_line(
-                    self.start_x + self.gate_b_x - self.gate_width/2 + 1, y,
-                    self.start_x + self.gate_b_x + self.gate_width/2 - 1, y,
-                    fill='#333333', width=1, tags="gates"
-                )
-        
-        # Gate B label with status
-        status_text = "OPENING" if (self.gate_b_moving and self.gate_b_target_state) else \
-                     "CLOSING" if (self.gate_b_moving and not self.gate_b_target_state) else \
-                     "OPEN" if self.gate_b_open else "CLOSED"
-        
-        self.canvas.create_text(
-            self.start_x + self.gate_b_x, self.start_y - 25,
-            text=f"Gate B", fill='white', font=('Arial', 12, 'bold'), tags="gates"
-        )
-        self.canvas.create_text(
-            self.start_x + self.gate_b_x, self.start_y - 10,
-            text=f"[{status_text}]", fill='yellow' if self.gate_b_moving else 'white', 
-            font=('Arial', 9), tags="gates"
-        )
+            # Main gate rectangle
+            coords(items['body'], gate_left, gate_y, gate_right, gate_bottom)
+            
+            # Add mechanical details (only when gate is substantially visible)
+            segment_ys = ()
+            if gate_height > 50:  # Increased threshold to reduce flicker
+                segment_height = 40  # Larger segments, fewer lines
+                segment_ys = range(int(gate_y + segment_height), int(gate_bottom), segment_height)
+            last['segments'] = self._place_gate_segments(items['segments'], segment_ys, gate_left,
+                                                         gate_right, last.get('segments', 0))
+        
+        # Simplified motion blur - one persistent subtle shadow, shown and
+        # positioned only while the gate is moving
+        blur = items['blur']
+        blur_state = 'normal' if moving else 'hidden'
+        if moving and (moved or blur_state != last.get('blur')):
+            coords(blur, gate_left - 2, gate_y - 2, gate_right + 2, gate_bottom + 2)
+        if blur_state != last.get('blur'):
+            last['blur'] = blur_state
+            itemconfig(blur, state=blur_state)
+        
+        if gate_color != last.get('fill'):
+            last['fill'] = gate_color
+            itemconfig(items['body'], fill=gate_color)
+        
+        # Gate label with status
+        status = _GATE_STATUS[moving, bool(gate.target_state if moving else is_open)]
+        if status is not last.get('status'):
+            last['status'] = status
+            status_text, status_fill = status
+            itemconfig(items['status'], text=status_text, fill=status_fill)
     
     def draw_rover(self):
-        # Draw rover as a rectangle with direction indicator
-        rover_color = '#0088ff'
-        self.canvas.create_rectangle(self.rover_x - self.rover_width/2,
-                                   self.rover_y - self.rover_height/2,
-                                   self.rover_x + self.rover_width/2,
-                                   self.rover_y + self.rover_height/2,
-                                   fill=rover_color, outline='white', width=3, tags="rover")
-        
-        # Add direction indicator
-        self.canvas.create_polygon(self.rover_x + self.rover_width/2 - 10, self.rover_y - 15,
-                                 self.rover_x + self.rover_width/2 + 10, self.rover_y,
-                                 self.rover_x + self.rover_width/2 - 10, self.rover_y + 15,
-                                 fill='yellow', outline='white', tags="rover")
-        
-        # Add rover label
-        self.canvas.create_text(self.rover_x, self.rover_y,
-                              text="ROVER", fill='white', font=('Arial', 10, 'bold'), tags="rover")
-        
+        # Shift all persistent rover items to the current position in one call
+        x, y = self.rover_x, self.rover_y
+        drawn_x, drawn_y = self._rover_drawn
+        if x != drawn_x or y != drawn_y:
+            self.canvas.move("rover", x - drawn_x, y - drawn_y)
+            self._rover_drawn = (x, y)
+    
     def update_sensors(self):
         # Calculate rover edges
-        rover_left = self.rover_x - self.rover_width/2
-        rover_right = self.rover_x + self.rover_width/2
-        
-        # Reset all sensors
-        old_states = self.sensor_states.copy()
-        
-        # Calculate sensor line positions at center of each zone
-        front_sensor_x = self.start_x + self.front_zone_width / 2
-        middle_sensor_x = self.start_x + self.front_zone_width + self.middle_zone_width / 2
-        back_sensor_x = self.start_x + self.front_zone_width + self.middle_zone_width + self.back_zone_width / 2
+        rover_left, _, rover_right, _ = self._rover_bbox
+        previous_bits = self._sensor_bits
         
         # Check presence sensors (trigger if any part of rover crosses sensor line)
-        self.sensor_states['PRESENCE_FRONT'] = rover_left <= front_sensor_x <= rover_right
-        self.sensor_states['PRESENCE_MIDDLE'] = rover_left <= middle_sensor_x <= rover_right
-        self.sensor_states['PRESENCE_BACK'] = rover_left <= back_sensor_x <= rover_right
+        for bit, _, sensor_x in self._presence_sensors:
+            self.set_sensor(bit, rover_left <= sensor_x <= rover_right)
         
         # Check gate safety sensors (based on rover edges, keep existing logic)
-        safety_zone_width = 60
-        
-        # Gate A safety
-        gate_a_pos = self.start_x + self.gate_a_x
-        if (rover_right > gate_a_pos - safety_zone_width/2 and 
-            rover_left < gate_a_pos + safety_zone_width/2):
-            self.sensor_states['GATE_SAFETY_A'] = True
+        for bit, _, _, zone_left, zone_right in self._safety_zones:
+            self.set_sensor(bit, rover_right > zone_left and rover_left < zone_right)
+        
+        # Update sensor labels, including the gate moving and gate request states
+        bits = self._sensor_bits
+        states = {name: bits >> bit & 1 for name, bit in _SENSOR_FIELDS}
+        states.update(self.gate_requests)
+        self.set_sensor_labels(states)
+        
+        # Request throttled update instead of immediate update; the zones are
+        # background unless a sensor actually changed state
+        if bits != previous_bits:
+            self.request_update('zones', 'rover')
         else:
-            self.sensor_states['GATE_SAFETY_A'] = False
-        
-        # Gate B safety
-        gate_b_pos = self.start_x + self.gate_b_x
-        if (rover_right > gate_b_pos - safety_zone_width/2 and 
-            rover_left < gate_b_pos + safety_zone_width/2):
-            self.sensor_states['GATE_SAFETY_B'] = True
+            self.request_update('rover')
+    
+    def get_sensor(self, bit):
+        """Return the state of one BIT_* sensor flag"""
+        return bool(self._sensor_bits >> bit & 1)
+    
+    def set_sensor(self, bit, value):
+        """Set or clear one BIT_* sensor flag"""
+        if value:
+            self._sensor_bits |= 1 << bit
         else:
-            self.sensor_states['GATE_SAFETY_B'] = False
-        
-        # Update sensor labels
-        for name, state in self.sensor_states.items():
-            if name in self.sensor_labels:
-                label = self.sensor_labels[name]
-                if state:
-                    label.config(text="ON", bg='#00ff00', fg='black')
-                else:
-                    label.config(text="OFF", bg='#4a4a4a', fg='white')
-        
-        # Update gate moving states in labels
-        self.sensor_labels['GATE_MOVING_A'].config(
-            text="ON" if self.gate_a_moving else "OFF",
-            bg='#00ff00' if self.gate_a_moving else '#4a4a4a',
-            fg='black' if self.gate_a_moving else 'white'
-        )
-        self.sensor_labels['GATE_MOVING_B'].config(
-            text="ON" if self.gate_b_moving else "OFF",
-            bg='#00ff00' if self.gate_b_moving else '#4a4a4a',
-            fg='black' if self.gate_b_moving else 'white'
-        )
-        
-        # Update gate request states in labels
-        self.sensor_labels['GATE_REQUEST_A'].config(
-            text="ON" if self.gate_requests['GATE_REQUEST_A'] else "OFF",
-            bg='#00ff00' if self.gate_requests['GATE_REQUEST_A'] else '#4a4a4a',
-            fg='black' if self.gate_requests['GATE_REQUEST_A'] else 'white'
-        )
-        self.sensor_labels['GATE_REQUEST_B'].config(
-            text="ON" if self.gate_requests['GATE_REQUEST_B'] else "OFF",
-            bg='#00ff00' if self.gate_requests['GATE_REQUEST_B'] else '#4a4a4a',
-            fg='black' if self.gate_requests['GATE_REQUEST_B'] else 'white'
-        )
-        
-        # Request throttled update instead of immediate update
-        self.request_update()
+            self._sensor_bits &= ~(1 << bit)
+    
+    def set_sensor_labels(self, states):
+        """Reconfigure, in one pass, only the state labels whose look changed"""
+        last = self._sensor_last
+        labels = self.sensor_labels
+        pending = {}
+        for name, state in states.items():
+            style = self._LABEL_ON if state else self._LABEL_OFF
+            if name in labels and last.get(name) is not style:
+                pending[name] = style
+        for name, style in pending.items():
+            last[name] = style
+            labels[name].configure(**style)
     
     def check_collision(self, new_x):
         # No collision detection - allow free movement for testing
         return False
     
+    def _recompute_layout(self):
+        """Derive the canvas geometry that stays fixed between frames"""
+        start_x = self.start_x
+        start_y = self.start_y
+        
+        # Sensor layout: presence lines at the center of each zone, safety areas around the gates
+        front_sensor_x = start_x + self.front_zone_width / 2
+        middle_sensor_x = start_x + self.front_zone_width + self.middle_zone_width / 2
+        back_sensor_x = start_x + self.front_zone_width + self.middle_zone_width + self.back_zone_width / 2
+        self._presence_sensors = ((BIT_PRESENCE_FRONT, "FRONT", front_sensor_x),
+                                  (BIT_PRESENCE_MIDDLE, "MIDDLE", middle_sensor_x),
+                                  (BIT_PRESENCE_BACK, "BACK", back_sensor_x))
+        self._sensor_line_top = start_y + 20
+        self._sensor_line_bottom = start_y + self.airlock_height - 20
+        
+        # Safety zones as (bit, label, center x, left x, right x)
+        half_zone = self.safety_zone_width / 2
+        self._safety_zones = tuple(
+            (bit, label, start_x + gate.x, start_x + gate.x - half_zone, start_x + gate.x + half_zone)
+            for bit, label, gate in ((BIT_GATE_SAFETY_A, "Gate A Safety", self.gate_a),
+                                     (BIT_GATE_SAFETY_B, "Gate B Safety", self.gate_b))
+        )
+        
+        half_gate = self.gate_width / 2
+        for gate in self.gates:
+            gate.left = start_x + gate.x - half_gate
+            gate.right = start_x + gate.x + half_gate
+        
+        self._rover_half_width = half_width = self.rover_width / 2
+        half_height = self.rover_height / 2
+        self._rover_top = self.rover_y - half_height
+        self._rover_bottom = self.rover_y + half_height
+        
+        # Rover shapes as (kind, point offsets from the rover center, options)
+        self._rover_template = (
+            ('rectangle', (-half_width, -half_height, half_width, half_height),
+             {'fill': '#0088ff', 'outline': 'white', 'width': 3}),
+            ('polygon', (half_width - 10, -15, half_width + 10, 0, half_width - 10, 15),
+             {'fill': 'yellow', 'outline': 'white'}),
+            ('text', (0, 0), {'text': "ROVER", 'fill': 'white', 'font': ('Arial', 10, 'bold')}),
+        )
+        self.move_rover_to(self.rover_x)  # Refresh the cached rover bounding box
+    
+    def move_rover_to(self, x):
+        """Set the rover position and refresh its cached bounding box"""
+        self.rover_x = x
+        half_width = self._rover_half_width
+        self._rover_bbox = (x - half_width, self._rover_top, x + half_width, self._rover_bottom)
+    
     def on_canvas_click(self, event):
         # Set focus to canvas for keyboard events
         self.canvas.focus_set()
         
         # Check if click is on rover
-        rover_left = self.rover_x - self.rover_width/2
-        rover_right = self.rover_x + self.rover_width/2
-        rover_top = self.rover_y - self.rover_height/2
-        rover_bottom = self.rover_y + self.rover_height/2
+        rover_left, rover_top, rover_right, rover_bottom = self._rover_bbox
         
         if rover_left <= event.x <= rover_right and rover_top <= event.y <= rover_bottom:
             self.rover_dragging = True
             self.drag_start_x = event.x - self.rover_x
-            print("Rover grabbed for dragging")
+            log.debug("Rover grabbed for dragging")
         else:
-            print(f"Clicked at ({event.x}, {event.y}), rover at ({self.rover_x}, {self.rover_y})")
+            log.debug("Clicked at (%s, %s), rover at (%s, %s)", event.x, event.y, self.rover_x, self.rover_y)
     
     def on_canvas_drag(self, event):
         if self.rover_dragging:
-            new_x = event.x - self.drag_start_x
-            self.rover_x = new_x
-            self.update_sensors()
-            print(f"Rover moved to x={self.rover_x}")
+            self._pending_x = event.x - self.drag_start_x
+            self._schedule_move()
     
     def on_canvas_release(self, event):
         if self.rover_dragging:
-            print("Rover released")
+            log.debug("Rover released")
         self.rover_dragging = False
     
     def on_key_press(self, event):
         step = 0.8
-        new_x = self.rover_x
+        # Build on a move that hasn't been applied yet so repeated keys add up
+        new_x = self.rover_x if self._pending_x is None else self._pending_x
         
         if event.keysym == 'Left':
-            new_x = self.rover_x - step
-            print("Left arrow pressed")
+            new_x -= step
+            log.debug("Left arrow pressed")
         elif event.keysym == 'Right':
-            new_x = self.rover_x + step
-            print("Right arrow pressed")
+            new_x += step
+            log.debug("Right arrow pressed")
         else:
             return
         
-        self.rover_x = new_x
+        self._pending_x = new_x
+        self._schedule_move()
+    
+    def _schedule_move(self):
+        """Apply pending rover moves once per idle pass instead of once per event"""
+        if not self._move_scheduled:
+            self._move_scheduled = True
+            self.root.after_idle(self._flush_move)
+    
+    def _flush_move(self):
+        """Move the rover to the latest pending position and re-check the sensors"""
+        self._move_scheduled = False
+        if self._pending_x is None:
+            return
+        self.move_rover_to(self._pending_x)
+        self._pending_x = None
         self.update_sensors()
-        print(f"Rover moved to x={self.rover_x}")
+        log.debug("Rover moved to x=%s", self.rover_x)
     
     def get_serial_ports(self):
         ports = serial.tools.list_ports.comports()
@@ -773,8 +974,12 @@ class AirlockGUI:
             return
         
         try:
-            self.ser = serial.Serial(port, 115200, timeout=1)
+            # Short read timeout for the reader thread, and a write timeout so a
+            # stalled adapter can't hold up the writer thread indefinitely
+            self.ser = serial.Serial(port, 115200, timeout=0.05, write_timeout=0.05)
             time.sleep(2)  # Wait for Arduino to initialize
+            self._rx_error = None  # Forget failures of a previous port
+            self._last_echoed_frame = None  # Echo the first frame on the new port
             self.connected = True
             self.connect_btn.config(text="Disconnect", bg='#f44336')
             self.status_label.config(text=f"Connected to {port}", fg='green')
@@ -788,10 +993,17 @@ class AirlockGUI:
             messagebox.showerror("Error", error_msg)
     
     def disconnect_serial(self):
-        if self.ser:
-            self.ser.close()
-            self.ser = None
+        # Stop the threads using the port first, then wake the reader out of a
+        # blocking read so the port isn't closed underneath it
+        ser = self.ser
         self.connected = False
+        self.ser = None
+        if ser:
+            try:
+                ser.cancel_read()
+            except (serial.SerialException, OSError, AttributeError):
+                pass  # Port already gone, or a port type without cancel_read
+            ser.close()
         self.connect_btn.config(text="Connect", bg='#4CAF50')
         self.status_label.config(text="Disconnected", fg='red')
         self.add_terminal_message("Serial connection closed", "INFO")
@@ -801,356 +1013,275 @@ class AirlockGUI:
             return
         
         # Format data as expected by Arduino
-        data_parts = []
-        for name, state in self.sensor_states.items():
-            if name not in ['GATE_MOVING_A', 'GATE_MOVING_B']:  # Don't send internal states
-                value = "1" if state else "0"
-                data_parts.append(f"{name}:{value}")
-        
-        # Add gate moving states
-        data_parts.append(f"GATE_MOVING_A:{'1' if self.gate_a_moving else '0'}")
-        data_parts.append(f"GATE_MOVING_B:{'1' if self.gate_b_moving else '0'}")
-        
-        message = "<" + ",".join(data_parts) + ">"
+        message = _SENSOR_FRAMES[self._sensor_bits]
         
+        self.queue_frame(message.encode())  # Echoed as SENT by the writer once written
+    
+    def queue_frame(self, data):
+        """Hand a sensor frame to the writer thread, replacing one it hasn't written yet"""
+        self._tx_frames.append(data)
         try:
-            self.ser.write(message.encode())
-            self.add_terminal_message(message, "SENT")
-        except serial.SerialException as e:
-            error_msg = f"Failed to send data: {str(e)}"
-            self.add_terminal_message(error_msg, "ERROR")
-            messagebox.showerror("Error", error_msg)
+            self._tx_queue.put_nowait(b"")  # Wake the writer
+        except queue.Full:
+            pass  # The writer has a backlog and will reach the frame anyway
+    
+    def queue_write(self, data):
+        """Hand bytes to the writer thread so a stalled port can't block the GUI"""
+        try:
+            self._tx_queue.put_nowait(data)
+            return True
+        except queue.Full:
+            self.add_terminal_message("Send queue full - serial port not keeping up", "ERROR")
+            return False
     
     def read_arduino_data(self):
-        if not self.connected or not self.ser:
-            return
+        ser = self.ser
+        if not self.connected or not ser:
+            return False
         
         try:
-            if self.ser.in_waiting > 0:
-                line = self.ser.readline().decode().strip()
-                print("LINE "+line)
-                print(line.startswith('<'))
-                
-                print(line[-1])
-                if line.startswith('<') and line.endswith('>'):
-                    # Parse the received data
-                    data = line[1:-1]  # Remove < and >
-                    pairs = data.split(',')
-                    for pair in pairs:
-                        if ':' in pair:
-                            name, value = pair.split(':')
-                            if name in self.gate_requests:
-                                old_value = self.gate_requests[name]
-                                self.gate_requests[name] = value == '1'
-                                print(f"DEBUG: {name} changed from {old_value} to {self.gate_requests[name]}")
-                    
-                    self.add_terminal_message(line, "RECEIVED")
-                    print(f"Received: {line}")
-                    print(f"DEBUG: Current gate requests: {self.gate_requests}")
-                    self.process_gate_requests()
-                elif line:  # Any other non-empty message
-                    self.add_terminal_message(line, "RECEIVED")
-        except serial.SerialException:
-            pass
+            # Take everything already buffered in one read; otherwise wait
+            # (up to the port timeout) for the next byte
+            data = ser.read(ser.in_waiting or 1)
+            if data:
+                self._rx_queue.put(data)  # Parsed on the GUI thread by poll_serial
+        except (serial.SerialException, OSError, TypeError) as e:
+            # pyserial raises TypeError when the port is closed during a read
+            if ser is not self.ser or not self.connected:
+                return False  # Closed by disconnect_serial, not a read error
+            # An unplugged adapter fails every read at once; back off and let
+            # the GUI thread disconnect
+            self._rx_error = str(e)
+            return False
+        return True
+    
+    def poll_serial(self):
+        """GUI-thread consumer: parse bytes handed over by the reader thread"""
+        error = self._rx_error
+        if error is not None:
+            self._rx_error = None
+            if self.connected:
+                self.add_terminal_message(f"Serial read failed: {error}", "ERROR")
+                self.disconnect_serial()
+        
+        received = False
+        while True:
+            try:
+                self._rxbuf += self._rx_queue.get_nowait()
+                received = True
+            except queue.Empty:
+                break
+        if received:
+            self._parse_rx_buffer()
+        self.root.after(self.serial_poll_interval, self.poll_serial)
+    
+    def _parse_rx_buffer(self):
+        """Dispatch every complete <...> frame in the receive buffer"""
+        buf = self._rxbuf
+        pos = 0
+        for match in _FRAME_RE.finditer(buf):
+            self._handle_rx_text(buf[pos:match.start()])
+            self._handle_rx_frame(match.group(1).decode('ascii', 'replace'))
+            pos = match.end()
+        
+        # Keep a partially received frame for the next read, flush plain text lines
+        frame_start = buf.find(b'<', pos)
+        keep_from = frame_start if frame_start >= 0 else max(pos, buf.rfind(b'\n', pos) + 1)
+        self._handle_rx_text(buf[pos:keep_from])
+        del buf[:keep_from]
+        
+        if len(buf) > _RX_BUFFER_LIMIT:
+            buf.clear()
+    
+    def _handle_rx_text(self, data):
+        """Show non-frame text from the Arduino in the terminal"""
+        for line in data.split(b'\n'):
+            line = line.strip()
+            if line:  # Any other non-empty message
+                self.add_terminal_message(line.decode('ascii', 'replace'), "RECEIVED")
+    
+    def _handle_rx_frame(self, data):
+        """Apply one received frame payload (without the < > delimiters)"""
+        line = f"<{data}>"
+        for name, value in _PAIR_RE.findall(data):
+            handler = self._rx_handlers.get(name)
+            if handler:
+                handler(value == '1')
+        
+        self.add_terminal_message(line, "RECEIVED")
+        log.debug("Received: %s", line)
+        log.debug("Current gate requests: %s", self.gate_requests)
+        self.process_gate_requests()
+    
+    def set_gate_request(self, name, value):
+        """Store a gate request received from the Arduino"""
+        old_value = self.gate_requests[name]
+        self.gate_requests[name] = value
+        log.debug("%s changed from %s to %s", name, old_value, value)
     
     def process_gate_requests(self):
-        print(f"DEBUG: Processing gate requests...")
-        print(f"DEBUG: Gate A - Request: {self.gate_requests['GATE_REQUEST_A']}, Open: {self.gate_a_open}, Moving: {self.gate_a_moving}, Target: {self.gate_a_target_state}")
-        print(f"DEBUG: Gate B - Request: {self.gate_requests['GATE_REQUEST_B']}, Open: {self.gate_b_open}, Moving: {self.gate_b_moving}, Target: {self.gate_b_target_state}")
-        
-        # Process gate A request - allow direction changes during movement
-        if self.gate_requests['GATE_REQUEST_A']:  # Request = 1: OPEN
-            if not self.gate_a_moving:
-                # Start opening if not moving and not fully open
-                if not self.gate_a_open:
-                    self.gate_a_target_state = True  # Opening
-                    self.gate_a_moving = True
-                    self.gate_a_animation_time = self.gate_animation_progress_a * self.gate_animation_duration
-                    self.sensor_states['GATE_MOVING_A'] = True
-                    print("Gate A: Starting to open (request = 1) with enhanced animation")
-                    
-                    # Create minimal initial particle (just 1)
-                    initial_particles = self.create_gate_particles(self.gate_a_x, 'opening')[:1]  # Only 1 particle
-                    self.gate_a_particles.extend(initial_particles)
-                else:
-                    print("DEBUG: Gate A already fully open - no movement needed")
-            else:
-                # Gate is moving - check if we need to change direction
-                if not self.gate_a_target_state:  # Currently closing, switch to opening
-                    self.gate_a_target_state = True  # Switch to opening
-                    # Calculate new animation time to continue from current position
-                    self.gate_a_animation_time = self.gate_animation_progress_a * self.gate_animation_duration
-                    print(f"Gate A: Switching to opening mid-movement from progress {self.gate_animation_progress_a}")
-                    
-                    # Create particles for direction change
-                    initial_particles = self.create_gate_particles(self.gate_a_x, 'opening')[:1]
-                    self.gate_a_particles.extend(initial_particles)
-                # If already opening, continue opening (no change needed)
-        else:  # Request = 0: CLOSE
-            if not self.gate_a_moving:
-                # Start closing if not moving and not fully closed
-                if self.gate_a_open:
-                    self.gate_a_target_state = False  # Closing
-                    self.gate_a_moving = True
-                    self.gate_a_animation_time = (1.0 - self.gate_animation_progress_a) * self.gate_animation_duration
-                    self.sensor_states['GATE_MOVING_A'] = True
-                    print("Gate A: Starting to close (request = 0) with enhanced animation")
-                    
-                    # Create minimal initial particle (just 1)
-                    initial_particles = self.create_gate_particles(self.gate_a_x, 'closing')[:1]  # Only 1 particle
-                    self.gate_a_particles.extend(initial_particles)
-                else:
-                    print("DEBUG: Gate A already fully closed - no movement needed")
-            else:
-                # Gate is moving - check if we need to change direction
-                if self.gate_a_target_state:  # Currently opening, switch to closing
-                    self.gate_a_target_state = False  # Switch to closing
-                    # Calculate new animation time to continue from current position
-                    self.gate_a_animation_time = (1.0 - self.gate_animation_progress_a) * self.gate_animation_duration
-                    print(f"Gate A: Switching to closing mid-movement from progress {self.gate_animation_progress_a}")
-                    
-                    # Create particles for direction change
-                    initial_particles = self.create_gate_particles(self.gate_a_x, 'closing')[:1]
-                    self.gate_a_particles.extend(initial_particles)
-                # If already closing, continue closing (no change needed)
-        
-        # Process gate B request - allow direction changes during movement
-        if self.gate_requests['GATE_REQUEST_B']:  # Request = 1: OPEN
-            if not self.gate_b_moving:
-                # Start opening if not moving and not fully open
-                if not self.gate_b_open:
-                    self.gate_b_target_state = True  # Opening
-                    self.gate_b_moving = True
-                    self.gate_b_animation_time = self.gate_animation_progress_b * self.gate_animation_duration
-                    self.sensor_states['GATE_MOVING_B'] = True
-                    print("Gate B: Starting to open (request = 1) with enhanced animation")
-                    
-                    # Create minimal initial particle (just 1)
-                    initial_particles = self.create_gate_particles(self.gate_b_x, 'opening')[:1]  # Only 1 particle
-                    self.gate_b_particles.extend(initial_particles)
-                else:
-                    print("DEBUG: Gate B already fully open - no movement needed")
-            else:
-                # Gate is moving - check if we need to change direction
-                if not self.gate_b_target_state:  # Currently closing, switch to opening
-                    self.gate_b_target_state = True  # Switch to opening
-                    # Calculate new animation time to continue from current position
-                    self.gate_b_animation_time = self.gate_animation_progress_b * self.gate_animation_duration
-                    print(f"Gate B: Switching to opening mid-movement from progress {self.gate_animation_progress_b}")
-                    
-                    # Create particles for direction change
-                    initial_particles = self.create_gate_particles(self.gate_b_x, 'opening')[:1]
-                    self.gate_b_particles.extend(initial_particles)
-                # If already opening, continue opening (no change needed)
-        else:  # Request = 0: CLOSE
-            if not self.gate_b_moving:
-                # Start closing if not moving and not fully closed
-                if self.gate_b_open:
-                    self.gate_b_target_state = False  # Closing
-                    self.gate_b_moving = True
-                    self.gate_b_animation_time = (1.0 - self.gate_animation_progress_b) * self.gate_animation_duration
-                    self.sensor_states['GATE_MOVING_B'] = True
-                    print("Gate B: Starting to close (request = 0) with enhanced animation")
-                    
-                    # Create minimal initial particle (just 1)
-                    initial_particles = self.create_gate_particles(self.gate_b_x, 'closing')[:1]  # Only 1 particle
-                    self.gate_b_particles.extend(initial_particles)
-                else:
-                    print("DEBUG: Gate B already fully closed - no movement needed")
-            else:
-                # Gate is moving - check if we need to change direction
-                if self.gate_b_target_state:  # Currently opening, switch to closing
-                    self.gate_b_target_state = False  # Switch to closing
-                    # Calculate new animation time to continue from current position
-                    self.gate_b_animation_time = (1.0 - self.gate_animation_progress_b) * self.gate_animation_duration
-                    print(f"Gate B: Switching to closing mid-movement from progress {self.gate_animation_progress_b}")
-                    
-                    # Create particles for direction change
-                    initial_particles = self.create_gate_particles(self.gate_b_x, 'closing')[:1]
-                    self.gate_b_particles.extend(initial_particles)
-                # If already closing, continue closing (no change needed)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Processing gate requests...")
+            for gate in self.gates:
+                log.debug("Gate %s - Request: %s, Open: %s, Moving: %s, Target: %s", gate.name,
+                          self.gate_requests[gate.request_key], gate.open, gate.moving, gate.target_state)
+        
+        for gate in self.gates:
+            self.process_gate_request(gate)
+    
+    def process_gate_request(self, gate):
+        """Start, or reverse, one gate's movement to follow its request"""
+        request = self.gate_requests[gate.request_key]
+        moving = gate.moving
+        action = _GATE_TRANSITIONS.get((request, moving, gate.target_state if moving else gate.open))
+        if action is None:
+            return  # Already at, or heading to, the requested position
+        
+        gate.target_state = request  # True = opening, False = closing
+        gate.moving = True
+        self.set_sensor(gate.moving_bit, True)
+        # Continue from the current position in the new direction
+        remaining = gate.progress if request else 1.0 - gate.progress
+        gate.animation_time = remaining * self.gate_animation_duration
+        log.debug("Gate %s: %s from progress %s", gate.name, action, gate.progress)
+        
+        # Create minimal particle effect (just 1) for the start or direction change
+        self.create_gate_particles(gate.particles, gate.x, 'opening' if request else 'closing')
+        self.request_update('gates', 'particles')
     
     def animate_gates(self):
-        dt = 0.1  # Increased delta time to 100ms for smoother, less frequent updates
-        gates_moving = False
-        animation_changed = False  # Track if animation state actually changed
-        
-        # Animate gate A
-        if self.gate_a_moving:
-            gates_moving = True
+        dt = self.animation_interval / 1000  # One animation tick
+        self._particle_tick += 1
+        for gate in self.gates:
+            # Only request update if something meaningful changed
+            if gate.moving and self._animate_gate(gate, dt):
+                self.request_update('gates')
+        
+        # Update particles; one more redraw after the last dies hides its item
+        for gate in self.gates:
+            if gate.particles:
+                gate.particles.update()
+                self.request_update('particles')
+    
+    def _animate_gate(self, gate, dt):
+        """Advance one moving gate by dt seconds, return True if it visibly changed"""
+        animation_changed = False
+        
+        # Check safety during movement
+        #safety_triggered = self.get_sensor(gate.safety_bit)
+        safety_triggered = False
+        if gate.target_state:  # Opening
+            # Always allow opening, even if safety is triggered
+            old_progress = gate.progress
+            gate.animation_time += dt
+            progress = min(gate.animation_time / self.gate_animation_duration, 1.0)
+            gate.progress = progress
             
-            # Check safety during movement
-            #safety_triggered = self.sensor_states['GATE_SAFETY_A']
-            safety_triggered=False
-            if self.gate_a_target_state:  # Opening
-                # Always allow opening, even if safety is triggered
-                old_progress = self.gate_animation_progress_a
-                self.gate_a_animation_time += dt
-                progress = min(self.gate_a_animation_time / self.gate_animation_duration, 1.0)
-                self.gate_animation_progress_a = progress
-                
-                # Only mark as changed if progress actually changed significantly
-                if abs(progress - old_progress) > 0.02:  # Increased threshold to 2%
-                    animation_changed = True
+            # Only mark as changed if progress actually changed significantly
+            if abs(progress - old_progress) > 0.02:  # Increased threshold to 2%
+                animation_changed = True
+            
+            # Create particles during opening (further reduced frequency)
+            if self._particle_tick % 50 == 0:  # One frame in 50
+                self.create_gate_particles(gate.particles, gate.x, 'opening')
+                animation_changed = True
+            
+            if progress >= 1.0:
+                gate.progress = 1.0
+                gate.open = True
+                gate.moving = False
+                gate.animation_time = 0
+                self.set_sensor(gate.moving_bit, False)
+                animation_changed = True
+                log.debug("Gate %s: Fully opened with enhanced animation", gate.name)
                 
-                # Create particles during opening (further reduced frequency)
-               
+                # Create burst of particles when fully opened (minimal burst)
+                self.create_gate_particles(gate.particles, gate.x, 'opened')  # Only 1 particle
                 
-                if progress >= 1.0:
-                    self.gate_animation_progress_a = 1.0
-                    self.gate_a_open = True
-                    self.gate_a_moving = False
-                    self.gate_a_animation_time = 0
-                    self.sensor_states['GATE_MOVING_A'] = False
-                    animation_changed = True
-                    print("Gate A: Fully opened with enhanced animation")
-                    
-                    # Create burst of particles when fully opened (minimal burst)
-                    burst_particles = self.create_gate_particles(self.gate_a_x, 'opened')[:1]  # Only 1 particle
-                    self.gate_a_particles.extend(burst_particles)
-                    
-            else:  # Closing
-                # Stop closing if safety is triggered, but allow to continue when clear
-                if not safety_triggered:
-                    old_progress = self.gate_animation_progress_a
-                    self.gate_a_animation_time += dt
-                    progress = min(self.gate_a_animation_time / self.gate_animation_duration, 1.0)
-                    self.gate_animation_progress_a = 1.0 - progress  # Reverse for closing
-                    
-                    # Only mark as changed if progress actually changed significantly
-                    if abs((1.0 - progress) - old_progress) > 0.02:  # Increased threshold to 2%
-                        animation_changed = True
-                    
-                    # Create particles during closing (minimal frequency)
-                    if random.random() < 0.01:  # Reduced to 1% chance each frame
-                        new_particles = self.create_gate_particles(self.gate_a_x, 'closing')
-                        self.gate_a_particles.extend(new_particles)
-                        animation_changed = True
-                    
-                    if progress >= 1.0:
-                        self.gate_animation_progress_a = 0.0
-                        self.gate_a_open = False
-                        self.gate_a_moving = False
-                        self.gate_a_animation_time = 0
-                        self.sensor_states['GATE_MOVING_A'] = False
-                        animation_changed = True
-                        print("Gate A: Fully closed with enhanced animation")
-                else:
-                    print("Gate A: Closing paused - safety triggered")
-        
-        # Animate gate B (similar to gate A)
-        if self.gate_b_moving:
-            gates_moving = True
-            
-            # Check safety during movement
-            #safety_triggered = self.sensor_states['GATE_SAFETY_B']
-            safety_triggered=False
-            if self.gate_b_target_state:  # Opening
-                # Always allow opening, even if safety is triggered
-                old_progress = self.gate_animation_progress_b
-                self.gate_b_animation_time += dt
-                progress = min(self.gate_b_animation_time / self.gate_animation_duration, 1.0)
-                self.gate_animation_progress_b = progress
+        else:  # Closing
+            # Stop closing if safety is triggered, but allow to continue when clear
+            if not safety_triggered:
+                old_progress = gate.progress
+                gate.animation_time += dt
+                progress = min(gate.animation_time / self.gate_animation_duration, 1.0)
+                gate.progress = 1.0 - progress  # Reverse for closing
                 
                 # Only mark as changed if progress actually changed significantly
-                if abs(progress - old_progress) > 0.02:  # Increased threshold to 2%
+                if abs((1.0 - progress) - old_progress) > 0.02:  # Increased threshold to 2%
                     animation_changed = True
                 
-                # Create particles during opening (further reduced frequency)
-                if random.random() < 0.02:  # Reduced to 2% chance each frame
-                    new_particles = self.create_gate_particles(self.gate_b_x, 'opening')
-                    self.gate_b_particles.extend(new_particles)
+                # Create particles during closing (minimal frequency)
+                if self._particle_tick % 100 == 0:  # One frame in 100
+                    self.create_gate_particles(gate.particles, gate.x, 'closing')
                     animation_changed = True
                 
                 if progress >= 1.0:
-                    self.gate_animation_progress_b = 1.0
-                    self.gate_b_open = True
-                    self.gate_b_moving = False
-                    self.gate_b_animation_time = 0
-                    self.sensor_states['GATE_MOVING_B'] = False
+                    gate.progress = 0.0
+                    gate.open = False
+                    gate.moving = False
+                    gate.animation_time = 0
+                    self.set_sensor(gate.moving_bit, False)
                     animation_changed = True
-                    print("Gate B: Fully opened with enhanced animation")
-                    
-                    # Create burst of particles when fully opened (minimal burst)
-                    burst_particles = self.create_gate_particles(self.gate_b_x, 'opened')[:1]  # Only 1 particle
-                    self.gate_b_particles.extend(burst_particles)
-                    
-            else:  # Closing
-                # Stop closing if safety is triggered, but allow to continue when clear
-                if not safety_triggered:
-                    old_progress = self.gate_animation_progress_b
-                    self.gate_b_animation_time += dt
-                    progress = min(self.gate_b_animation_time / self.gate_animation_duration, 1.0)
-                    self.gate_animation_progress_b = 1.0 - progress  # Reverse for closing
-                    
-                    # Only mark as changed if progress actually changed significantly
-                    if abs((1.0 - progress) - old_progress) > 0.02:  # Increased threshold to 2%
-                        animation_changed = True
-                    
-                    # Create particles during closing (minimal frequency)
-                    if random.random() < 0.01:  # Reduced to 1% chance each frame
-                        new_particles = self.create_gate_particles(self.gate_b_x, 'closing')
-                        self.gate_b_particles.extend(new_particles)
-                        animation_changed = True
-                    
-                    if progress >= 1.0:
-                        self.gate_animation_progress_b = 0.0
-                        self.gate_b_open = False
-                        self.gate_b_moving = False
-                        self.gate_b_animation_time = 0
-                        self.sensor_states['GATE_MOVING_B'] = False
-                        animation_changed = True
-                        print("Gate B: Fully closed with enhanced animation")
-                else:
-                    print("Gate B: Closing paused - safety triggered")
-        
-        # Update particles and check if any exist
-        if self.gate_a_particles or self.gate_b_particles:
-            self.gate_a_particles = self.update_particles(self.gate_a_particles)
-            self.gate_b_particles = self.update_particles(self.gate_b_particles)
-            animation_changed = True
-        
-        # Only request update if something meaningful changed
-        if animation_changed:
-            self.request_update()
+                    log.debug("Gate %s: Fully closed with enhanced animation", gate.name)
+            else:
+                log.debug("Gate %s: Closing paused - safety triggered", gate.name)
+        
+        return animation_changed
     
     def start_reading_thread(self):
         def read_loop():
             while True:
-                self.read_arduino_data()
-                time.sleep(0.05)  # Read every 50ms
+                # read_arduino_data waits on the port itself; only idle when
+                # disconnected or after a failed read
+                if not self.read_arduino_data():
+                    time.sleep(0.05)
         
         thread = threading.Thread(target=read_loop, daemon=True)
         thread.start()
     
-    def start_animation_thread(self):
-        def animation_loop():
+    def start_writing_thread(self):
+        def write_loop():
             while True:
-                self.animate_gates()
-                time.sleep(0.1)  # Increased to 100ms for smoother, less frequent updates
-        
-        thread = threading.Thread(target=animation_loop, daemon=True)
-        thread.start()
-    
-    def start_sensor_update_thread(self):
-        def sensor_update_loop():
-            while True:
-                if self.connected:
-                    self.send_data()
-                time.sleep(0.1)  # Send sensor data every 100ms
-        
-        thread = threading.Thread(target=sensor_update_loop, daemon=True)
+                # Coalesce everything queued so far into a single write
+                chunks = [self._tx_queue.get()]
+                while True:
+                    try:
+                        chunks.append(self._tx_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    frame = self._tx_frames.popleft()  # Only the newest sensor state
+                    chunks.append(frame)
+                except IndexError:
+                    frame = None
+                
+                ser = self.ser
+                if not self.connected or not ser:
+                    continue  # Drop data queued before a disconnect
+                try:
+                    ser.write(b"".join(chunks))
+                    # Echo the frame only once it was written, and skip unchanged repeats
+                    if frame is not None and frame != self._last_echoed_frame:
+                        self._last_echoed_frame = frame
+                        self.add_terminal_message(frame.decode(), "SENT")
+                except serial.SerialTimeoutException:
+                    # Drop the batch; the next tick sends the current sensor state again
+                    self.add_terminal_message("Serial write timed out - data dropped", "ERROR")
+                except serial.SerialException as e:
+                    self.add_terminal_message(f"Failed to send data: {str(e)}", "ERROR")
+        
+        thread = threading.Thread(target=write_loop, daemon=True)
         thread.start()
     
-    def start_sensor_display_update_thread(self):
-        def sensor_display_update_loop():
-            while True:
-                if self.connected:
-                    self.update_display()
-                time.sleep(0.1)  # Send sensor display data every 100ms
-        
-        thread = threading.Thread(target=sensor_display_update_loop, daemon=True)
-        thread.start()
+    def _tick(self):
+        """Periodic GUI-thread update: animate gates and send sensors. The
+        display is redrawn only when one of them marks it dirty"""
+        self.animate_gates()
+        # Send every tick, even unchanged: the HIL board's replyToPython() only
+        # answers with the gate requests after it receives a frame, so this is
+        # also what polls them. The writer echoes only frames that changed
+        self.send_data()
+        self.root.after(self.animation_interval, self._tick)
     
     def on_closing(self):
         self.disconnect_serial()
@@ -1159,95 +1290,105 @@ class AirlockGUI:
     def on_canvas_focus(self, event):
         self.canvas.focus_set()
 
-    def ease_in_out_cubic(self, t):
-        """Smooth easing function for natural movement"""
-        if t < 0.5:
-            return 4 * t * t * t
-        else:
-            return 1 - pow(-2 * t + 2, 3) / 2
-    
-    def create_gate_particles(self, gate_x, gate_type):
-        """Create particle effects for gate movement"""
-        particles = []
+    def create_gate_particles(self, particles, gate_x, gate_type):
+        """Emit particle effects for gate movement into a particle buffer"""
         particle_count = 1  # Minimal particles - only 1 per creation
+        uniform = self._rng.uniform
         
         for _ in range(particle_count):
-            particle = {
-                'x': self.start_x + gate_x + random.uniform(-3, 3),  # Very small spread
-                'y': self.start_y + random.uniform(60, self.airlock_height - 60),
-                'vx': random.uniform(-0.3, 0.3),  # Very slow movement
-                'vy': random.uniform(-0.8, -0.2),  # Very slow movement
-                'life': 1.0,
-                'size': random.uniform(1, 1.5)  # Very small particles
-            }
-            particles.append(particle)
-        return particles
-    
-    def update_particles(self, particles):
-        """Update particle positions and remove dead particles"""
-        alive_particles = []
-        for particle in particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 0.015  # Very slow fade out
-            particle['size'] *= 0.998  # Very slow size reduction
-            
-            if particle['life'] > 0 and particle['size'] > 0.9:  # Live longer
-                alive_particles.append(particle)
-        
-        return alive_particles
+            particles.emit(
+                self.start_x + gate_x + uniform(-3, 3),  # Very small spread
+                self.start_y + uniform(60, self.airlock_height - 60),
+                uniform(-0.3, 0.3),  # Very slow movement
+                uniform(-0.8, -0.2),  # Very slow movement
+                uniform(1, 1.5)  # Very small particles
+            )
     
-    def draw_particles(self, particles):
-        """Draw particle effects"""
-        for particle in particles:
-            alpha = max(0, min(255, int(particle['life'] * 255)))  # Clamp alpha value
-            if alpha > 100:  # Only draw clearly visible particles
+    def draw_particles(self):
+        """Paint particle effects as small squares into each gate's particle strip"""
+        painted = self._painted_strips
+        if not painted and not any(gate.particles for gate in self.gates):
+            return  # Idle: every strip is already blank
+        yellow = _YELLOW_LEVELS
+        origin_y = self.start_y
+        for gate in self.gates:
+            particles = gate.particles
+            if not particles and gate.name not in painted:
+                continue  # Nothing to draw and nothing to erase
+            image, origin_x = self._particle_strips[gate.name]
+            if gate.name in painted:
+                image.blank()  # Back to fully transparent
+                painted.discard(gate.name)
+            put = image.put
+            width = image.width()
+            height = image.height()
+            xs, ys, lives, sizes = particles.x, particles.y, particles.life, particles.size
+            # Every particle starts at full life and fades at the same rate, so
+            # walking from the newest, the first dim one ends the visible run
+            for i in range(particles.count - 1, -1, -1):
+                alpha = int(lives[i] * 255)  # Live particles are always within (0, 1]
+                if alpha <= 100:  # Only draw clearly visible particles
+                    break
                 # Create a simple glowing effect
-                alpha_hex = f"{alpha:02x}"
-                color = f"#{alpha_hex}{alpha_hex}00"  # Yellow particles
-                size = max(1.0, particle['size'])  # Minimum size
-                
-                # Simple particle drawing
-                x1 = particle['x'] - size
-                y1 = particle['y'] - size 
-                x2 = particle['x'] + size
-                y2 = particle['y'] + size
+                color = yellow[alpha]  # Yellow particles
+                size = max(1.0, sizes[i])  # Minimum size
                 
-                self.canvas.create_oval(
-                    x1, y1, x2, y2,
-                    fill=color, outline="", tags="particles"
-                )
+                # Simple particle drawing, clipped to the image
+                x = xs[i] - origin_x
+                y = ys[i] - origin_y
+                left = max(0, int(x - size))
+                top = max(0, int(y - size))
+                right = min(width, max(int(x + size), left + 1))
+                bottom = min(height, max(int(y + size), top + 1))
+                if left < right and top < bottom:
+                    put(color, to=(left, top, right, bottom))
+                    painted.add(gate.name)
 
-    def request_update(self, force=False):
-        """Throttled update system to prevent flickering"""
-        current_time = time.time()
-        
-        if force or (current_time - self.last_update_time) >= self.min_update_interval:
-            if not self.update_pending:
-                self.update_pending = True
-                # Schedule update on next GUI cycle
-                self.root.after(10, self._perform_update)
+    def request_update(self, *parts, force=False):
+        """Mark parts of the display dirty (all by default) and schedule a single throttled redraw"""
+        self._dirty.update(parts or self._DISPLAY_PARTS)
+        if self._display_dirty:
+            return  # A redraw is already scheduled and will pick this change up
+        self._display_dirty = True
+        
+        # Run as soon as the rate cap allows, coalescing changes made until then;
+        # when the cap has already passed, redraw once pending events are handled
+        wait = 0 if force else self.min_update_interval - (time.monotonic() - self.last_update_time)
+        if wait > 0:
+            self.root.after(max(1, int(wait * 1000)), self._perform_update)
+        else:
+            self.root.after_idle(self._perform_update)
     
     def _perform_update(self):
         """Actually perform the update - called from GUI thread"""
-        if self.update_pending:
-            self.update_pending = False
-            self.last_update_time = time.time()
+        if self._display_dirty:
+            self._display_dirty = False
+            self.last_update_time = self._frame_time = time.monotonic()  # One clock read per frame
             
             # Single unified update that minimizes canvas operations
             self._unified_update()
     
     def _unified_update(self):
         """Single method that handles all visual updates efficiently"""
-        # Remove only dynamic elements in one operation
-        self.canvas.delete("sensor_zones", "gates", "rover", "particles")
-        
-        # Redraw everything in the correct order
-        self.draw_sensor_zones()
-        self.draw_gates()
-        self.draw_rover()
+        # Every item is persistent - the static background is never touched and
+        # only the parts marked dirty are moved/recolored
+        dirty = self._dirty
+        if not dirty:
+            return
+        if 'zones' in dirty:
+            self.draw_sensor_zones()
+        if 'gates' in dirty:
+            self.draw_gates()
+        if 'particles' in dirty:
+            # Particles are stepped once per tick in animate_gates; only draw them here
+            self.draw_particles()
+        if 'rover' in dirty:
+            self.draw_rover()
+        dirty.clear()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG if os.environ.get("AIRLOCK_DEBUG") else logging.WARNING,
+                        format="%(levelname)s: %(message)s")
     root = tk.Tk()
     app = AirlockGUI(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)